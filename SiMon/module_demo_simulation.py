@@ -1,9 +1,4 @@
 from SiMon.simulation import Simulation
-import re
-import os
-import subprocess
-import time
-import glob
 
 __simulation__ = "DemoSimulation"
 
@@ -25,17 +20,7 @@ class DemoSimulation(Simulation):
             sim_id, name, full_dir, status, mode, t_min, t_max, restarts, logger
         )
 
-    def sim_get_model_time(self):
-        super(DemoSimulation, self).sim_get_model_time()
-        orig_dir = os.getcwd()
-        os.chdir(self.full_dir)
-        if "Output_file" in self.config:
-            output_file = self.config["Output_file"]
-            regex = re.compile("\\d+")
-            if os.path.isfile(output_file):
-                last_line = subprocess.check_output(["tail", "-1", output_file]).decode('utf-8')
-                res = regex.findall(last_line)
-                if len(res) > 0:
-                    self.t = float(res[0])
-        os.chdir(orig_dir)
-        return self.t
+    # sim_get_model_time is inherited from Simulation: the base implementation
+    # already parses the model time from the configured output file using
+    # absolute paths, which keeps it safe under the scheduler's concurrent
+    # status probes (a chdir-based override here would race across threads).
@@ -1,10 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
+from SiMon._iouring_stat import batch_statx
 from SiMon.scheduler import Scheduler
 from SiMon.simulation import Simulation
 from SiMon.simulation_container import SimulationContainer
-from SiMon import config 
-import os 
-import numpy as np 
+from SiMon import config
+import os
 
 
 class PriorityScheduler(Scheduler):
@@ -24,61 +25,87 @@ class PriorityScheduler(Scheduler):
         sim_niceness_vec = []
         sim_id_vec = []
 
+        # bind the loop invariants once instead of re-resolving the attribute
+        # chain and re-parsing the config value on every iteration
+        sim_inst_dict = self.container.sim_inst_dict
+        max_concurrent_jobs = int(self.config['Max_concurrent_jobs'])
+
+        # Update the status of all instances. The probes are I/O-bound (they
+        # read output files and stat checkpoints), so dispatch them through a
+        # thread pool and let the reads overlap instead of paying the I/O
+        # latency once per simulation.
+        insts = [inst for i, inst in sim_inst_dict.items() if i != 0]
+        if len(insts) > 0:
+            # stat every candidate output file in one batch up front (a single
+            # io_uring submission where available), so the probes below hit the
+            # cache instead of issuing a stat per file
+            stat_paths = []
+            for inst in insts:
+                stat_paths.extend(inst.sim_stat_paths())
+            stat_cache = batch_statx(stat_paths)
+            with ThreadPoolExecutor(max_workers=min(32, len(insts))) as executor:
+                list(
+                    executor.map(
+                        lambda inst: inst.sim_get_status(stat_cache=stat_cache),
+                        insts,
+                    )
+                )
+
         # check how many simulations are running
         concurrent_jobs = 0
-        for i in self.container.sim_inst_dict.keys():
-            inst = self.container.sim_inst_dict[i]
+        for inst in sim_inst_dict.values():
             sim_niceness_vec.append(inst.niceness)
             sim_id_vec.append(inst.id)
-            inst.sim_get_status()  # update its status
             # test if the process is running
             if inst.status == Simulation.STATUS_RUN and inst.cid == -1:
                 concurrent_jobs += 1
 
-        index_niceness_sorted = np.argsort(sim_niceness_vec)
-        for _, i in enumerate(index_niceness_sorted):
-            ind = sim_id_vec[i]
-            if (
-                self.container.sim_inst_dict[ind].status != Simulation.STATUS_DONE
-                and self.container.sim_inst_dict[ind].id > 0
-            ):
-                schedule_list.append(self.container.sim_inst_dict[ind])
+        # argsort on a small Python list: stay with the C-level builtin sort
+        # instead of paying the list -> numpy array conversion
+        index_niceness_sorted = sorted(
+            range(len(sim_niceness_vec)), key=sim_niceness_vec.__getitem__
+        )
+        for i in index_niceness_sorted:
+            inst = sim_inst_dict[sim_id_vec[i]]
+            if inst.status != Simulation.STATUS_DONE and inst.id > 0:
+                schedule_list.append(inst)
 
         for sim in schedule_list:
             if sim.id == 0:  # the root group, skip
                 continue
-            sim.sim_get_status()  # update its status
-            self.logger.debug("Checking instance #%d ==> %s [%s]" % (sim.id, sim.name, sim.status))
-            if sim.status == Simulation.STATUS_RUN:
+            status = sim.sim_get_status()  # update its status
+            self.logger.debug("Checking instance #%d ==> %s [%s]", sim.id, sim.name, status)
+            if status == Simulation.STATUS_RUN:
                 sim.sim_backup_checkpoint()
-            elif sim.status == Simulation.STATUS_STALL:
+            elif status == Simulation.STATUS_STALL:
                 sim.sim_kill()
                 self.container.build_simulation_tree()
-            elif sim.status == Simulation.STATUS_STOP and sim.level == 1:
-                self.logger.warning("STOP detected: " + sim.fulldir)
+            elif status == Simulation.STATUS_STOP and sim.level == 1:
+                self.logger.warning("STOP detected: %s", sim.fulldir)
                 # check if there is available slot to restart the simulation
-                if concurrent_jobs < int(self.config['Max_concurrent_jobs']) and sim.level == 1:
+                if concurrent_jobs < max_concurrent_jobs:
                     # search only top level instance to find the restart candidate
                     # build restart path
                     current_inst = sim
                     # restart the simulation instance at the leaf node
                     while current_inst.cid != -1:
-                        current_inst = self.container.sim_inst_dict[current_inst.cid]
+                        current_inst = sim_inst_dict[current_inst.cid]
                     print(
                         "RESTART: #%d ==> %s" % (current_inst.id, current_inst.fulldir)
                     )
                     self.logger.info(
-                        "RESTART: #%d ==> %s" % (current_inst.id, current_inst.fulldir)
+                        "RESTART: #%d ==> %s", current_inst.id, current_inst.fulldir
                     )
                     current_inst.sim_restart()
                     concurrent_jobs += 1
-            elif sim.status == Simulation.STATUS_NEW:
+            elif status == Simulation.STATUS_NEW:
                 # check if there is available slot to start the simulation
-                if concurrent_jobs < int(self.config['Max_concurrent_jobs']):
+                if concurrent_jobs < max_concurrent_jobs:
                     # Start new run
                     sim.sim_start()
                     concurrent_jobs += 1
         self.logger.info(
-            "SiMon routine checking completed. Machine load: %d/%d"
-            % (concurrent_jobs, int(self.config['Max_concurrent_jobs']))
+            "SiMon routine checking completed. Machine load: %d/%d",
+            concurrent_jobs,
+            max_concurrent_jobs,
         )
\ No newline at end of file
@@ -3,19 +3,15 @@ import os.path
 import sys
 import time
 import logging
-import glob
 # from daemonize import Daemonize
 
-import numpy as np
-
-import daemon 
+import daemon
 from daemon import pidfile
 from daemonize import Daemonize
 from SiMon import utilities
-from SiMon import config 
+from SiMon import config
 from SiMon.simulation_container import SimulationContainer
 from SiMon.priority_scheduler import PriorityScheduler
-from SiMon.visualization import VisualizationCallback 
 
 
 
@@ -102,6 +98,13 @@ class SiMon(object):
         self.logger = logger
         self.max_concurrent_jobs = 2
 
+        # resolve the daemon sleep interval once; the daemon loop should not
+        # re-read the config dict on every tick
+        if "Daemon_sleep_time" in self.config:
+            self.daemon_sleep_time = float(self.config["Daemon_sleep_time"])
+        else:
+            self.daemon_sleep_time = 180.0
+
         self.simulations = None
         self.callbacks = []
         self.scheduler = None 
@@ -123,7 +126,12 @@ class SiMon(object):
             print(self.config)
             if 'Visualization' in self.config:
                 if self.config['Visualization']['Enabled'] is True:
-                    self.callbacks.append(VisualizationCallback(container=self.simulations, 
+                    # imported lazily: the visualization stack pulls in
+                    # matplotlib and numpy, which the daemon should not pay
+                    # for unless plotting is actually enabled
+                    from SiMon.visualization import VisualizationCallback
+
+                    self.callbacks.append(VisualizationCallback(container=self.simulations,
                                                                 plot_dir=os.path.join(self.cwd, self.config['Visualization']['Dir'])))
 
             # create a scheduler 
@@ -134,6 +142,20 @@ class SiMon(object):
 
 
 
+    # Per-simulation interactive tasks: option ==> (Simulation method to call,
+    # error message fragment when the selected ID does not exist, whether the
+    # selection list is cleared after the action).
+    _task_dispatch = {
+        "n": ("sim_start", "Simulation not started", True),
+        "r": ("sim_restart", "Simulation not restarted", True),
+        "c": ("sim_collect_recent_output_message", "Cannot check status", False),
+        "t": ("sim_stop", "Simulation not stopped", False),
+        "d": ("sim_delete", "Cannot delete simulation", True),
+        "k": ("sim_kill", "Cannot kill simulation", True),
+        "b": ("sim_backup_checkpoint", "Cannot backup checkpoint", False),
+        "p": ("sim_finalize", "Cannot perform postprocessing", True),
+    }
+
     def interactive_task_handler(self, opt):
         """
         Handles the task selection input from the user (in the interactive mode).
@@ -144,7 +166,7 @@ class SiMon(object):
         if opt == "q":  # quit interactive mode
             sys.exit(0)
         if opt == "l":  # list all simulations
-            print(self.simulations)
+            sys.stdout.writelines(self.simulations.iter_lines())
         if opt in ["s", "n", "r", "c", "x", "t", "d", "k", "b", "p"]:
             if self.mode == "interactive":
                 if (
@@ -159,43 +181,6 @@ class SiMon(object):
                         "Instances %s selected.\n" % self.simulations.selected_inst
                     )
 
-        # TODO: use message? to rewrite this part in a smarter way
-        if opt == "n":  # start new simulations
-            for sid in self.simulations.selected_inst:
-                sim_inst = self.simulations.get_simulation_by_id(sid)
-                if sim_inst is not None:
-                    sim_inst.sim_start()
-                    # reset the selection list
-                    self.simulations.selected_inst = []
-                else:
-                    print(
-                        "The selected simulation with ID = %d does not exist. Simulation not started.\n"
-                        % sid
-                    )
-        if opt == "r":  # restart simulations
-            for sid in self.simulations.selected_inst:
-                sim_inst = self.simulations.get_simulation_by_id(sid)
-                if sim_inst is not None:
-                    sim_inst.sim_restart()
-                    # reset the selection list
-                    self.simulations.selected_inst = []
-                else:
-                    print(
-                        "The selected simulation with ID = %d does not exist. Simulation not restarted.\n"
-                        % sid
-                    )
-        if (
-            opt == "c"
-        ):  # check the recent or current status of the simulation and print it
-            for sid in self.simulations.selected_inst:
-                sim_inst = self.simulations.get_simulation_by_id(sid)
-                if sim_inst is not None:
-                    sim_inst.sim_collect_recent_output_message()
-                else:
-                    print(
-                        "The selected simulation with ID = %d does not exist. Simulation not restarted.\n"
-                        % sid
-                    )
         if opt == "x":  # execute an UNIX shell command in the simulation directory
             print("Executing an UNIX shell command in the selected simulations.")
             shell_command = utilities.get_input("CMD>> ")
@@ -208,67 +193,19 @@ class SiMon(object):
                         "The selected simulation with ID = %d does not exist. Cannot execute command.\n"
                         % sid
                     )
-        if (
-            opt == "t"
-        ):  # soft-stop the simulation in the ways that supported by the code
+        elif opt in SiMon._task_dispatch:
+            method_name, err_msg, resets_selection = SiMon._task_dispatch[opt]
             for sid in self.simulations.selected_inst:
                 sim_inst = self.simulations.get_simulation_by_id(sid)
                 if sim_inst is not None:
-                    sim_inst.sim_stop()
+                    getattr(sim_inst, method_name)()
+                    if resets_selection:
+                        # reset the selection list
+                        self.simulations.selected_inst = []
                 else:
                     print(
-                        "The selected simulation with ID = %d does not exist. Simulation not stopped.\n"
-                        % sid
-                    )
-        if opt == "d":  # delete the simulation tree and all its data
-            for sid in self.simulations.selected_inst:
-                sim_inst = self.simulations.get_simulation_by_id(sid)
-                if sim_inst is not None:
-                    sim_inst.sim_delete()
-                    # reset the selection list
-                    self.simulations.selected_inst = []
-                else:
-                    print(
-                        "The selected simulation with ID = %d does not exist. Cannot delete simulation.\n"
-                        % sid
-                    )
-        if opt == "k":  # kill the UNIX process associate with a simulation task
-            for sid in self.simulations.selected_inst:
-                sim_inst = self.simulations.get_simulation_by_id(sid)
-                if sim_inst is not None:
-                    sim_inst.sim_kill()
-                    # reset the selection list
-                    self.simulations.selected_inst = []
-                else:
-                    print(
-                        "The selected simulation with ID = %d does not exist. Cannot kill simulation.\n"
-                        % sid
-                    )
-        if (
-            opt == "b"
-        ):  # backup the simulation checkpoint files (for restarting purpose in the future)
-            for sid in self.simulations.selected_inst:
-                sim_inst = self.simulations.get_simulation_by_id(sid)
-                if sim_inst is not None:
-                    sim_inst.sim_backup_checkpoint()
-                else:
-                    print(
-                        "The selected simulation with ID = %d does not exist. Cannot backup checkpoint.\n"
-                        % sid
-                    )
-        if (
-            opt == "p"
-        ):  # perform (post)-processing (usually after the simulation is done)
-            for sid in self.simulations.selected_inst:
-                sim_inst = self.simulations.get_simulation_by_id(sid)
-                if sim_inst is not None:
-                    sim_inst.sim_finalize()
-                    # reset the selection list
-                    self.simulations.selected_inst = []
-                else:
-                    print(
-                        "The selected simulation with ID = %d does not exist. Cannot perform postprocessing.\n"
-                        % sid
+                        "The selected simulation with ID = %d does not exist. %s.\n"
+                        % (sid, err_msg)
                     )
 
 
@@ -278,18 +215,18 @@ class SiMon(object):
         """
         if not self.__inited:
             self.initialize()
-            
-        os.chdir(self.cwd)
+
+        # __init__ already moved the process to self.cwd; re-issuing the chdir
+        # syscall every run is only needed if something changed it since
+        if os.getcwd() != self.cwd:
+            os.chdir(self.cwd)
         self.simulations.build_simulation_tree()
         while True:
             # print('[%s] Auto scheduled' % datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S'))
             self.scheduler.schedule()
             sys.stdout.flush()
             sys.stderr.flush()
-            if "Daemon_sleep_time" in self.config:
-                time.sleep(self.config["Daemon_sleep_time"])
-            else:
-                time.sleep(180)
+            time.sleep(self.daemon_sleep_time)
 
     def interactive_mode(self, autoquit=False):
         """
@@ -300,8 +237,9 @@ class SiMon(object):
         if not self.__inited:
             self.initialize()
 
-        os.chdir(self.cwd)
-        print(self.simulations)
+        if os.getcwd() != self.cwd:
+            os.chdir(self.cwd)
+        sys.stdout.writelines(self.simulations.iter_lines())
         choice = ""
         if autoquit is False:
             while choice != "q":
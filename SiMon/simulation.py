@@ -14,11 +14,9 @@ import time
 import sys
 import re
 import shutil
-from abc import ABC 
+from abc import ABC
 from SiMon import utilities
 
-import configparser as cp  # Python 3 only
-
 
 class Simulation(ABC):
     """
@@ -123,9 +121,13 @@ class Simulation(ABC):
         else:
             self.config = {}
 
-    def __repr__(self, level=0):
+    def iter_lines(self, level=0):
+        """
+        Yield the status overview of this simulation and its restarts one line at a time, so that a large
+        tree can be streamed to the terminal without first being assembled into a single string.
+        """
         if level == 0:
-            ret = "%s %s\n" % (
+            yield "%s %s\n" % (
                 # Simulation.STATUS_LABEL[self.status],
                 utilities.highlighted_text('Root:', 'yellow', bold=True),
                 utilities.highlighted_text(self.full_dir, 'yellow', bold=True),
@@ -153,7 +155,7 @@ class Simulation(ABC):
                 progress_bar,
             )
 
-            ret = "[%s]\t%s%d%s%s\n" % (
+            yield "[%s]\t%s%d%s%s\n" % (
                 Simulation.STATUS_LABEL[self.status],
                 placeholder_space,
                 self.id,
@@ -162,8 +164,10 @@ class Simulation(ABC):
             )
             # ret = "    "*level+str(self.id)+repr(self.name)+"\n"
         for child in self.restarts:
-            ret += child.__repr__(level + 1)
-        return ret
+            yield from child.iter_lines(level + 1)
+
+    def __repr__(self, level=0):
+        return "".join(self.iter_lines(level))
 
     # def parse_config_file(self):
     #     """
@@ -211,39 +215,42 @@ class Simulation(ABC):
         start_script_template = "%s & echo $!>.process.pid"
         orig_dir = os.getcwd()
         os.chdir(self.full_dir)
-
-        # Test if the process is running accoding to the .process.pid file
-        if os.path.isfile(".process.pid"):
-            # if the PID file exists, try to read the process ID
-            f_pid = open(".process.pid", "r")
-            pid = int(f_pid.readline().strip())
-            f_pid.close()
-            if pid > 0:
-                try:
-                    os.kill(pid, 0)
-                    return 1  # if no exception, the process is already running
-                except (ValueError, OSError):
-                    pass  # process not started yet
-        # If the process is not started yet, then start it in a normal way
-        if "Start_command" in self.config:
-            start_cmd = self.config["Start_command"]
-            # self.proc = subprocess.Popen(start_cmd, shell=True)
-            os.system(start_script_template % start_cmd)
-            # sleep for a little while to make sure that the pid file exist
-            time.sleep(0.5)
-            fpid = open(".process.pid", "r")
-            pid = int(fpid.readline())
-            fpid.close()
-            self.config["PID"] = pid
-            self.config["Timestamp_started"] = time.time()
-            utilities.update_config_file(self.config_file, self.config, section='Simulation')
-            if self.logger is not None:
-                msg = "Simulation %s started, PID = %d" % (self.name, pid)
-                self.logger.info(msg)
-        else:
-            return -1
-        os.chdir(orig_dir)
-        return 0
+        # the finally clause restores the working directory on every return
+        # path; an early return must not leave the process chdir'ed into the
+        # simulation directory
+        try:
+            # Test if the process is running accoding to the .process.pid file
+            if os.path.isfile(".process.pid"):
+                # if the PID file exists, try to read the process ID
+                f_pid = open(".process.pid", "r")
+                pid = int(f_pid.readline().strip())
+                f_pid.close()
+                if pid > 0:
+                    try:
+                        os.kill(pid, 0)
+                        return 1  # if no exception, the process is already running
+                    except (ValueError, OSError):
+                        pass  # process not started yet
+            # If the process is not started yet, then start it in a normal way
+            if "Start_command" in self.config:
+                start_cmd = self.config["Start_command"]
+                # self.proc = subprocess.Popen(start_cmd, shell=True)
+                os.system(start_script_template % start_cmd)
+                # sleep for a little while to make sure that the pid file exist
+                time.sleep(0.5)
+                fpid = open(".process.pid", "r")
+                pid = int(fpid.readline())
+                fpid.close()
+                self.config["PID"] = pid
+                self.config["Timestamp_started"] = time.time()
+                utilities.update_config_file(self.config_file, self.config, section='Simulation')
+                if self.logger is not None:
+                    self.logger.info("Simulation %s started, PID = %d", self.name, pid)
+            else:
+                return -1
+            return 0
+        finally:
+            os.chdir(orig_dir)
 
     def sim_restart(self):
         """
@@ -262,83 +269,89 @@ class Simulation(ABC):
         restart_script_template = "%s & echo $!>.process.pid"
         orig_dir = os.getcwd()
         os.chdir(self.full_dir)
-        print("The full dir is %s" % self.full_dir)
-        print("restarting simulation: %s" % self.full_dir)
-        if self.logger is not None:
-            self.logger.info("Restarting simulation: %s" % self.full_dir)
-        # Test if the process is running accoding to the .process.pid file
-        if os.path.isfile(".process.pid"):
-            # if the PID file exists, try to read the process ID
-            f_pid = open(".process.pid", "r")
-            pid = int(f_pid.readline().strip())
-            f_pid.close()
-            if pid > 0:
-                try:
-                    os.kill(pid, 0)
-                    return 1  # if no exception, the process is already running
-                except (ValueError, OSError):
-                    # process not started yet
-                    # check how many times the simulation has been restarted
-                    restarts = glob.glob("restart*/")
-                    n_restarts = len(restarts)
-                    # check whether it exceeds the maximum times of restarts specified in the per-sim config file
-                    if self.config["Max_restarts"]:
-                        if n_restarts > self.config["Max_restarts"]:
-                            # if exceed, create an empty file called 'ERROR'
-                            f_error = open("ERROR", "w")
-                            f_error.close()
-                            msg = (
-                                "Simulation %s has been restarted too many times. Further restart skipped..."
-                                % self.full_dir
-                            )
-                            print(msg)
-                            if self.logger is not None:
-                                self.logger.error(msg)
-                            return -2
-                    else:
-                        # if the config entry Max_restarts does not exist in the config file, there is no restart limit
-                        pass
-                    # now try to restart the simulation
-                    if "Restart_command" in self.config:
-                        restart_cmd = self.config["Restart_command"]
-                        if restart_cmd != "" and restart_cmd.strip() != "None":
-                            msg = "Restarting simulation: %s" % self.full_dir
-                            print(msg)
-                            if self.logger is not None:
-                                self.logger.info(msg)
-                            # create a restart dir
-                            restart_dir = "restart%d" % (n_restarts + 1)
-                            os.mkdir(restart_dir)
-                            os.chdir(restart_dir)
-                            os.system(restart_script_template % restart_cmd)
-                            # sleep for a little while to make sure that the pid file exist
-                            time.sleep(0.5)
-                            fpid = open(".process.pid", "r")
-                            pid = int(fpid.readline())
-                            fpid.close()
-                            self.config["PID"] = pid
-                            self.config["Timestamp_started"] = time.time()
-                            utilities.update_config_file(self.config_file, self.config, section='Simulation')
+        # the finally clause restores the working directory on every return
+        # path (already running, Max_restarts exceeded, misconfigured restart
+        # command); an early return must not leave the process chdir'ed into
+        # the simulation directory
+        try:
+            print("The full dir is %s" % self.full_dir)
+            print("restarting simulation: %s" % self.full_dir)
+            if self.logger is not None:
+                self.logger.info("Restarting simulation: %s", self.full_dir)
+            # Test if the process is running accoding to the .process.pid file
+            if os.path.isfile(".process.pid"):
+                # if the PID file exists, try to read the process ID
+                f_pid = open(".process.pid", "r")
+                pid = int(f_pid.readline().strip())
+                f_pid.close()
+                if pid > 0:
+                    try:
+                        os.kill(pid, 0)
+                        return 1  # if no exception, the process is already running
+                    except (ValueError, OSError):
+                        # process not started yet
+                        # check how many times the simulation has been restarted
+                        restarts = glob.glob("restart*/")
+                        n_restarts = len(restarts)
+                        # check whether it exceeds the maximum times of restarts specified in the per-sim config file
+                        if self.config["Max_restarts"]:
+                            if n_restarts > self.config["Max_restarts"]:
+                                # if exceed, create an empty file called 'ERROR'
+                                f_error = open("ERROR", "w")
+                                f_error.close()
+                                msg = (
+                                    "Simulation %s has been restarted too many times. Further restart skipped..."
+                                    % self.full_dir
+                                )
+                                print(msg)
+                                if self.logger is not None:
+                                    self.logger.error(msg)
+                                return -2
+                        else:
+                            # if the config entry Max_restarts does not exist in the config file, there is no restart limit
+                            pass
+                        # now try to restart the simulation
+                        if "Restart_command" in self.config:
+                            restart_cmd = self.config["Restart_command"]
+                            if restart_cmd != "" and restart_cmd.strip() != "None":
+                                msg = "Restarting simulation: %s" % self.full_dir
+                                print(msg)
+                                if self.logger is not None:
+                                    self.logger.info(msg)
+                                # create a restart dir
+                                restart_dir = "restart%d" % (n_restarts + 1)
+                                os.mkdir(restart_dir)
+                                os.chdir(restart_dir)
+                                os.system(restart_script_template % restart_cmd)
+                                # sleep for a little while to make sure that the pid file exist
+                                time.sleep(0.5)
+                                fpid = open(".process.pid", "r")
+                                pid = int(fpid.readline())
+                                fpid.close()
+                                self.config["PID"] = pid
+                                self.config["Timestamp_started"] = time.time()
+                                utilities.update_config_file(self.config_file, self.config, section='Simulation')
+                            else:
+                                msg = (
+                                    "%s: unable to restart because the restart command is not properly configured."
+                                    % self.name
+                                )
+                                print(msg)
+                                if self.logger is not None:
+                                    self.logger.error(msg)
+                                return -1
                         else:
                             msg = (
-                                "%s: unable to restart because the restart command is not properly configured."
+                                "%s: unable to restart because the restart command is not configured."
                                 % self.name
                             )
                             print(msg)
                             if self.logger is not None:
                                 self.logger.error(msg)
                             return -1
-                    else:
-                        msg = (
-                            "%s: unable to restart because the restart command is not configured."
-                            % self.name
-                        )
-                        print(msg)
-                        if self.logger is not None:
-                            self.logger.error(msg)
-                        return -1
-        os.chdir(orig_dir)
-        return 0
+            return 0
+        finally:
+            os.chdir(orig_dir)
 
     def sim_get_model_time(self):
         """
@@ -349,10 +362,8 @@ class Simulation(ABC):
 
         :return: the current model time
         """
-        orig_dir = os.getcwd()
-        os.chdir(self.full_dir)
         if "Output_file" in self.config:
-            output_file = self.config["Output_file"]
+            output_file = os.path.join(self.full_dir, self.config["Output_file"])
             regex = re.compile("\\d+")
             if os.path.isfile(output_file):
                 last_line = subprocess.check_output(["tail", "-1", output_file]).decode(
@@ -361,7 +372,6 @@ class Simulation(ABC):
                 res = regex.findall(last_line)
                 if len(res) > 0:
                     self.t = float(res[0])
-        os.chdir(orig_dir)
         return self.t
 
     def sim_get_model_start_time(self):
@@ -386,16 +396,36 @@ class Simulation(ABC):
         """
         return self.t_max
 
-    def sim_get_status(self):
+    def sim_stat_paths(self):
+        """
+        Collect the absolute paths of the files whose timestamps sim_get_status() inspects, so that a caller
+        probing many simulations can stat them in one batch (see SiMon._iouring_stat.batch_statx) and pass
+        the results back via the stat_cache argument.
+
+        :return: a list of absolute file paths (possibly empty).
+        """
+        paths = []
+        if self.config:
+            if "Output_file" in self.config:
+                paths.append(os.path.join(self.full_dir, self.config["Output_file"]))
+            elif "Error_file" in self.config:
+                paths.append(os.path.join(self.full_dir, self.config["Error_file"]))
+        return paths
+
+    def sim_get_status(self, stat_cache=None):
         """
         Get the current status of the simulation. Update the config file if necessary.
 
+        :param stat_cache: an optional dict mapping absolute file paths to stat results (None for missing
+        files), as returned by SiMon._iouring_stat.batch_statx. When given, the cached results are used
+        instead of issuing a stat syscall per output file.
         :return: The code of the current simulation status.
         """
         if self.config is None:
             return 0
-        orig_dir = os.getcwd()
-        os.chdir(self.full_dir)
+        # Use absolute paths rather than os.chdir() here: the status probe may
+        # run concurrently for many simulations, and the working directory is
+        # process-wide state.
         self.t = self.sim_get_model_time()
         self.t_min = self.sim_get_model_start_time()
 
@@ -403,21 +433,34 @@ class Simulation(ABC):
         output_file = ""
         if "Output_file" in self.config:
             output_file = self.config["Output_file"]
-            if os.path.isfile(output_file):
-                self.mtime = os.stat(output_file).st_mtime
+            output_path = os.path.join(self.full_dir, output_file)
+            if stat_cache is not None and output_path in stat_cache:
+                st = stat_cache[output_path]
+            elif os.path.isfile(output_path):
+                st = os.stat(output_path)
+            else:
+                st = None
+            if st is not None:
+                self.mtime = st.st_mtime
         elif "Error_file" in self.config:
-            error_file = self.config["Error_file"]
-            if os.path.isfile(error_file):
-                self.mtime = os.stat(error_file).st_mtime
+            error_path = os.path.join(self.full_dir, self.config["Error_file"])
+            if stat_cache is not None and error_path in stat_cache:
+                st = stat_cache[error_path]
+            elif os.path.isfile(error_path):
+                st = os.stat(error_path)
+            else:
+                st = None
+            if st is not None:
+                self.mtime = st.st_mtime
 
         # Get the starting time of the simulation
         if "Timestamp_started" in self.config:
             self.ctime = self.config["Timestamp_started"]
 
         # Determine whether the simulation is running using the process ID
-        if os.path.isfile(".process.pid"):
+        if os.path.isfile(os.path.join(self.full_dir, ".process.pid")):
             # if the PID file exists, try to read the process ID
-            f_pid = open(".process.pid", "r")
+            f_pid = open(os.path.join(self.full_dir, ".process.pid"), "r")
             pid = int(f_pid.readline().strip())
             f_pid.close()
             if pid == 0:
@@ -460,11 +503,10 @@ class Simulation(ABC):
                     else:
                         if self.ctime == 0.0:
                             self.status = Simulation.STATUS_NEW
-                        elif os.path.isfile("ERROR"):
+                        elif os.path.isfile(os.path.join(self.full_dir, "ERROR")):
                             self.status = Simulation.STATUS_ERROR
                         else:
                             self.status = Simulation.STATUS_STOP
-        os.chdir(orig_dir)
         return self.status
 
     def sim_kill(self):
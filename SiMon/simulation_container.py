@@ -3,9 +3,10 @@
 A container for simulations.
 
 """
-import os 
-from fnmatch import fnmatch
-import configparser as cp 
+import os
+import re
+import fnmatch
+from collections import deque
 from SiMon.simulation import Simulation
 from SiMon import utilities
 
@@ -23,25 +24,75 @@ class SimulationContainer(object):
         self.selected_inst = []  # A list of the IDs of selected simulation instances
         self.sim_inst_dict = dict() # the container of all Simulation objects (ID to object mapping)
         self.sim_inst_parent_dict = dict() # given the current path, find out the instance of the parent
+        self._insts_by_level = dict() # tree level ==> list of instances, filled during the BFS scan
+        self._restart_nominations = [] # restart-candidate records collected during the BFS scan
+
+        # Persistent state across rebuilds: full path ==> (instance, directory
+        # mtime at the previous scan). Directories whose mtime is unchanged are
+        # not re-instantiated on the next scan.
+        self._inst_by_dir = dict()
+        self._dir_mtimes = dict()
         
         self.sim_tree = Simulation(0, "root", root_dir, Simulation.STATUS_NEW)
         self.module_dict = utilities.register_simon_modules(module_dir=utilities.get_simon_dir(), user_shell_dir=os.getcwd())
         
-    def traverse_simulation_dir_tree(self, pattern, base_dir, files):
+    def _bfs_scan(self, pattern="*"):
         """
-        Traverse the simulation file structure tree (Breadth-first search), until the leaf (i.e. no restart directory)
+        Traverse the simulation file structure tree (breadth-first search), until the leaf (i.e. no restart directory)
         or the simulation is not restartable (directory with the 'STOP' file).
+
+        The traversal maintains an explicit queue of (directory, parent instance) pairs and iterates each
+        directory with `os.scandir()`, whose `DirEntry` objects cache the file type from the directory read
+        itself, avoiding an extra `stat()` call per entry.
         """
-        for filename in sorted(files):
-            if fnmatch(filename, pattern):
-                if os.path.isdir(os.path.join(base_dir, filename)):
-                    fullpath = os.path.join(base_dir, filename)
-                    self.inst_id += 1
-                    id = self.inst_id
-
-                    # Try to determine the simulation code type by reading the config file
+        # compile the glob once per scan instead of re-translating it per entry;
+        # '*' (the only pattern used internally) matches everything, so matching
+        # is skipped entirely in that case
+        if pattern == "*":
+            pattern_match = None
+        else:
+            pattern_match = re.compile(fnmatch.translate(pattern)).match
+        queue = deque([(self.root_dir, self.sim_tree)])
+        while queue:
+            base_dir, parent_inst = queue.popleft()
+            try:
+                with os.scandir(base_dir) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError:
+                continue
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if pattern_match is not None and pattern_match(entry.name) is None:
+                    continue
+                fullpath = entry.path
+                filename = entry.name
+                self.inst_id += 1
+                id = self.inst_id
+
+                dir_mtime = entry.stat(follow_symlinks=False).st_mtime
+                prev_inst = self._inst_by_dir.get(fullpath)
+                if prev_inst is not None and self._dir_mtimes.get(fullpath) == dir_mtime:
+                    # The directory is unchanged since the previous scan, so the
+                    # existing instance can be reused instead of re-instantiated.
+                    # Reset it to the state a fresh construction produces (the
+                    # constructor defaults, then the config parse; the status
+                    # probe below then runs like for any other instance), so
+                    # that reuse is purely an optimization and a rebuild over
+                    # an unchanged tree is idempotent.
+                    sim_inst = prev_inst
+                    sim_inst.restarts = []
+                    sim_inst.cid = -1
+                    sim_inst.status = Simulation.STATUS_NEW
+                    sim_inst.t = 0
+                    sim_inst.t_max_extended = 0
+                    sim_inst.parse_config_file()
+                else:
+                    # Try to determine the simulation code type by reading the config file.
+                    # entry.path is already an absolute POSIX path, so plain string
+                    # concatenation replaces the os.path.join machinery in this loop.
                     sim_config = utilities.parse_config_file(
-                        os.path.join(fullpath, "SiMon.conf"),
+                        fullpath + "/SiMon.conf",
                         section='Simulation'
                     )
                     sim_inst = None
@@ -57,39 +108,56 @@ class SimulationContainer(object):
                                     Simulation.STATUS_NEW,
                                     logger=utilities.get_logger(),
                                 )
-                        except (cp.NoOptionError, cp.NoSectionError):
+                        except KeyError:
+                            # Code_name missing from the per-simulation config
                             pass
                     else:
                         # If there is no SiMon.conf file, then it is not considered as a valid SiMon simulation directory
                         continue
                     if sim_inst is None:
                         continue
-                    self.sim_inst_dict[id] = sim_inst
-                    sim_inst.id = id
-                    sim_inst.fulldir = fullpath
-                    sim_inst.name = filename
-
-                    # register child to the parent
-                    self.sim_inst_parent_dict[base_dir].restarts.append(sim_inst)
-                    sim_inst.level = self.sim_inst_parent_dict[base_dir].level + 1
-                    # register the node itself in the parent tree
-                    self.sim_inst_parent_dict[fullpath] = sim_inst
-                    sim_inst.parent_id = self.sim_inst_parent_dict[base_dir].id
-
-                    # Get simulation status
-                    sim_inst.sim_get_status()
-
-                    self.sim_inst_dict[sim_inst.parent_id].status = sim_inst.status
-
-                    if (
-                        sim_inst.t > self.sim_inst_dict[sim_inst.parent_id].t
-                        and not os.path.isfile(os.path.join(sim_inst.fulldir, "ERROR"))
-                    ) or sim_inst.status == Simulation.STATUS_RUN:
-                        # nominate as restart candidate
-                        self.sim_inst_dict[sim_inst.parent_id].cid = sim_inst.id
-                        self.sim_inst_dict[
-                            sim_inst.parent_id
-                        ].t_max_extended = sim_inst.t_max_extended
+                self._inst_by_dir[fullpath] = sim_inst
+                self._dir_mtimes[fullpath] = dir_mtime
+                self.sim_inst_dict[id] = sim_inst
+                sim_inst.id = id
+                sim_inst.fulldir = fullpath
+                sim_inst.name = filename
+
+                # register child to the parent
+                parent_inst.restarts.append(sim_inst)
+                sim_inst.level = parent_inst.level + 1
+                self._insts_by_level.setdefault(sim_inst.level, []).append(sim_inst)
+                # register the node itself in the parent tree
+                self.sim_inst_parent_dict[fullpath] = sim_inst
+                sim_inst.parent_id = parent_inst.id
+
+                # Get simulation status
+                sim_inst.sim_get_status()
+
+                self.sim_inst_dict[sim_inst.parent_id].status = sim_inst.status
+
+                try:
+                    os.stat(fullpath + "/ERROR")
+                    has_error = True
+                except FileNotFoundError:
+                    has_error = False
+                # record the data needed to nominate this instance as its
+                # parent's restart candidate; the collected records are applied
+                # in one linear pass after the walk instead of writing back
+                # into the parent objects while traversing
+                self._restart_nominations.append(
+                    (
+                        sim_inst.parent_id,
+                        sim_inst.id,
+                        sim_inst.t,
+                        sim_inst.t_max_extended,
+                        has_error,
+                        sim_inst.status,
+                    )
+                )
+
+                # descend into the simulation directory to look for restarted runs
+                queue.append((fullpath, sim_inst))
 
     def build_simulation_tree(self):
         """
@@ -99,8 +167,11 @@ class SimulationContainer(object):
         :return: The method has no return. The result is stored in self.sim_tree.
         :type: None
         """
-        os.chdir(self.root_dir)
+        # No chdir here: the BFS scan addresses everything through absolute
+        # paths, so the process working directory can stay untouched.
         self.sim_inst_dict = dict()
+        self._insts_by_level = dict()
+        self._restart_nominations = []
 
         self.sim_tree = Simulation(
             0, "root", self.root_dir, Simulation.STATUS_NEW
@@ -112,36 +183,38 @@ class SimulationContainer(object):
         ] = self.sim_tree  # map the current dir to be the sim tree root
         self.inst_id = 0
 
-        for directory, dirnames, filenames in os.walk(self.root_dir):
-            self.traverse_simulation_dir_tree("*", directory, dirnames)
-
-        # Synchronize the status tree (status propagation)
-        update_needed = True
-        max_iter = 0
-        while update_needed and max_iter < 30:
-            max_iter += 1
-            inst_status_modified = False
-            for i in self.sim_inst_dict:
-                if i == 0:
-                    continue
-                inst = self.sim_inst_dict[i]
+        self._bfs_scan()
+
+        # Apply the restart-candidate nominations collected during the scan in
+        # one pass over the contiguous record list; records are in traversal
+        # order, so for each parent the last qualifying child (in sorted name
+        # order) wins, exactly as when the writes happened inline
+        for parent_id, child_id, t, t_max_extended, has_error, status in self._restart_nominations:
+            parent = self.sim_inst_dict[parent_id]
+            if (t > parent.t and not has_error) or status == Simulation.STATUS_RUN:
+                parent.cid = child_id
+                parent.t_max_extended = t_max_extended
+
+        # Synchronize the status tree (status propagation): one bottom-up pass in
+        # reverse level order suffices, since by the time a level is visited the
+        # status of all deeper restarts has already been propagated into it
+        for level in sorted(self._insts_by_level, reverse=True):
+            for inst in self._insts_by_level[level]:
                 if (
-                    inst.status == Simulation.STATUS_RUN
-                    or inst.status == Simulation.STATUS_DONE
+                    inst.status in (Simulation.STATUS_RUN, Simulation.STATUS_DONE)
+                    and inst.parent_id > 0
                 ):
-                    if (
-                        inst.parent_id > 0
-                        and self.sim_inst_dict[inst.parent_id].status != inst.status
-                    ):
-                        # propagate the status of children (restarted simulation) to parents' status
-                        self.sim_inst_dict[inst.parent_id].status = inst.status
-                        inst_status_modified = True
-            if inst_status_modified is True:
-                update_needed = True
-            else:
-                update_needed = False
+                    # propagate the status of children (restarted simulation) to parents' status
+                    self.sim_inst_dict[inst.parent_id].status = inst.status
         return 0
-        print(self.sim_tree)
+
+    def iter_lines(self):
+        """
+        Rebuild the simulation tree and yield its status overview line by line, so that callers can stream
+        it to the terminal instead of materializing the whole overview string.
+        """
+        self.build_simulation_tree()
+        return self.sim_tree.iter_lines()
 
     def __repr__(self, level=0):
         """
@@ -150,11 +223,7 @@ class SimulationContainer(object):
         :return: start and stop time
         :rtype: int
         """
-        self.build_simulation_tree()
-        # print(
-            # self.sim_tree
-        # )  # print the root node will cause the whole tree to be printed
-        return self.sim_tree.__repr__()
+        return "".join(self.iter_lines())
 
     def get_simulation_by_id(self, sid):
         if sid in self.sim_inst_dict:
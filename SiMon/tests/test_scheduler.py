@@ -0,0 +1,73 @@
+import os
+import shutil
+import logging
+import tempfile
+import unittest
+
+from SiMon.priority_scheduler import PriorityScheduler
+from SiMon.simulation_container import SimulationContainer
+
+
+config_file_template = """[Simulation]
+Code_name = "DemoSimulation"
+Input_file = "input.txt"
+Output_file = "output.txt"
+Error_file = "error.txt"
+Timestamp_started = 0.0
+Stall_time = 7200
+T_start = 0.0
+T_end = 30.0
+PID = 0
+Niceness = %d
+Start_command = "true"
+Restart_command = "true"
+Stop_command = "touch STOP"
+Max_restarts = 2
+"""
+
+
+class TestPriorityScheduler(unittest.TestCase):
+    """
+    Run full scheduler ticks over a tree with many simulations.
+
+    Regression test: the status probes run concurrently in a thread pool, so
+    they must not rely on the process working directory (os.chdir is
+    process-wide state); a chdir-based probe makes schedule() crash on trees
+    of this size and leaves the daemon stranded in a simulation directory.
+    """
+
+    n_sim = 30
+
+    def setUp(self):
+        self.root_dir = tempfile.mkdtemp(prefix="simon_test_")
+        for i in range(self.n_sim):
+            sim_dir = os.path.join(self.root_dir, "sim_%02d" % i)
+            os.mkdir(sim_dir)
+            with open(os.path.join(sim_dir, "SiMon.conf"), "w") as conf_file:
+                conf_file.write(config_file_template % (i % 5))
+            with open(os.path.join(sim_dir, "output.txt"), "w") as output_file:
+                output_file.write("t = %d\n" % i)
+        self.logger = logging.getLogger("TestPriorityScheduler")
+        self.logger.addHandler(logging.NullHandler())
+
+    def tearDown(self):
+        shutil.rmtree(self.root_dir, ignore_errors=True)
+
+    def test_schedule_ticks(self):
+        container = SimulationContainer(root_dir=self.root_dir)
+        # Max_concurrent_jobs = 0 so that no simulation process is started
+        scheduler = PriorityScheduler(
+            container, self.logger, {"Max_concurrent_jobs": 0}, []
+        )
+        cwd_before = os.getcwd()
+        for _ in range(3):
+            scheduler.schedule()
+
+        # the ticks must not move the process working directory
+        self.assertEqual(os.getcwd(), cwd_before)
+
+        insts = [inst for i, inst in container.sim_inst_dict.items() if i != 0]
+        self.assertEqual(len(insts), self.n_sim)
+        # each instance must report the model time of its own output file
+        for inst in insts:
+            self.assertEqual(inst.t, float(int(inst.name.split("_")[1])))
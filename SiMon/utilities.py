@@ -3,11 +3,12 @@ Implementation of utilities used by SiMon globally.
 """
 
 import sys
-import os 
-import glob 
-import logging 
-import toml 
-import configparser as cp 
+import os
+import fnmatch
+import importlib
+import pkgutil
+import logging
+import toml
 from SiMon import config
 
 config_file_template = """# Global config file for SiMon
@@ -136,7 +137,7 @@ def id_input(prompt):
 
 def get_input(prompt_msg):
     """
-    This method makes use of the raw_input() method in Python2 and input() method in Python 3.
+    Prompt the user for input (kept as a thin wrapper so that tests can patch it).
     """
     return input(prompt_msg)
 
@@ -148,6 +149,12 @@ def generate_conf():
     except IOError:
         print("Unexpected error:", sys.exc_info()[0])
 
+# Cache of parsed config files, keyed by absolute path. Each entry stores the
+# mtime of the file at parse time, so that an unchanged file is parsed only once
+# even when the simulation tree is traversed repeatedly.
+_conf_cache = dict()
+
+
 def parse_config_file(config_file, section=None):
     """
     Parse the configure file (SiMon.conf) for starting SiMon. The basic information of Simulation root directory
@@ -161,10 +168,17 @@ def parse_config_file(config_file, section=None):
     :return: return 0 if succeed, -1 if failed (file not exist, and cannot be created). If the file does not exist
     but a new file with default values is created, the method returns 1.
     """
-    # conf = cp.ConfigParser()
-    if os.path.isfile(config_file):
-        # conf.read(config_file)
-        conf = toml.load(config_file)
+    config_file = os.path.abspath(config_file)
+    try:
+        mtime = os.stat(config_file).st_mtime
+    except OSError:
+        mtime = None
+    if mtime is not None:
+        if config_file in _conf_cache and _conf_cache[config_file][0] == mtime:
+            conf = _conf_cache[config_file][1]
+        else:
+            conf = toml.load(config_file)
+            _conf_cache[config_file] = (mtime, conf)
         if section is not None:
             if section in conf:
                 return conf[section]
@@ -233,20 +247,22 @@ def register_simon_modules(module_dir, user_shell_dir, module_pattern='module_*.
     :return: A dict-like mapping between the name of the code and the filename of the module.
     """
     mod_dict = dict()
-    module_candidates = glob.glob(os.path.join(module_dir, module_pattern))
-    module_cwd = glob.glob(
-        os.path.join(user_shell_dir, module_pattern)
-    )  # load the modules also from cwd
-    for m_cwd in module_cwd:
-        module_candidates.append(m_cwd)
-    for mod_name in module_candidates:
-        sys.path.append(module_dir)
-        sys.path.append(os.getcwd())
-        mod_name = os.path.basename(mod_name)
-        mod = __import__(mod_name.split(".")[0])
+    # scan the SiMon package directory and the user's working directory
+    search_dirs = [module_dir, user_shell_dir]
+    for search_dir in search_dirs:
+        if search_dir not in sys.path:
+            sys.path.append(search_dir)
+    if module_pattern.endswith(".py"):
+        name_pattern = module_pattern[:-3]
+    else:
+        name_pattern = module_pattern
+    for finder, mod_name, ispkg in pkgutil.iter_modules(search_dirs):
+        if ispkg or not fnmatch.fnmatch(mod_name, name_pattern):
+            continue
+        mod = importlib.import_module(mod_name)
         if hasattr(mod, "__simulation__"):
             # it is a valid SiMon module
-            mod_dict[mod.__simulation__] = mod_name.split(".")[0]
+            mod_dict[mod.__simulation__] = mod_name
     return mod_dict
 
 def get_logger(log_level='INFO', log_dir=None, log_file='SiMon.log'):    
@@ -36,47 +36,38 @@ class VisualizationCallback(Callback):
             return 
         
         num_sim = len(sim_inst_dict)
-        status = np.array([])
-        progresses = np.array([])
-        sim_idx = np.array([])
-        for i, sim_name in enumerate(sim_inst_dict):
+        sims = []
+        for sim_name in sim_inst_dict:
             sim = sim_inst_dict[sim_name]
-            sim_id = sim.id 
-            if sim_id == 0:
+            if sim.id == 0:
                 continue # skip the root simulation instance, which is only a place holder
-            
+
             # only plot level=1 simulations
             if sim.level > 1:
                 continue
+            sims.append(sim)
 
-            s = sim.sim_get_status()
-            if sim.t_max > 0:
-                p = sim.t / sim.t_max
-            else:
-                p = 0.0
-            status = np.append(s, status)
-            progresses = np.append(p, progresses)
-            sim_idx = np.append(sim_id, sim_idx)
+        n_plot = len(sims)
+        if n_plot == 0:
+            return
 
-        # Checks if num_sim has a square
-        if int(math.sqrt(num_sim) + 0.5) ** 2 == num_sim:
-            number = int(math.sqrt(num_sim))
-            y_num = num_sim // number
+        # build the per-simulation arrays in one pass each instead of growing
+        # them element-by-element with np.append
+        status = np.fromiter(
+            (sim.sim_get_status() for sim in sims), dtype=np.int8, count=n_plot
+        )
+        progresses = np.fromiter(
+            ((sim.t / sim.t_max) if sim.t_max > 0 else 0.0 for sim in sims),
+            dtype=np.float32,
+            count=n_plot,
+        )
+        sim_idx = np.fromiter((sim.id for sim in sims), dtype=np.int32, count=n_plot)
 
-        # If not square, find divisible number to get rectangle
-        else:
-            number = int(math.sqrt(num_sim))
-            while num_sim % number != 0:
-                number = number - 1
-            y_num = num_sim // number                               # Y-axis limit
-
-            # If prime number
-            if number == 1:
-                number = int(math.sqrt(num_sim)) + 1                # Make sure graph fits all num_sim
-                y_num = number
-                # 'Removes' extra white line if graph is too big
-                if (y_num * number) > num_sim and ((y_num - 1) * number) >= num_sim:
-                    y_num = y_num - 1
+        # Near-square grid that fits all simulations, in closed form: isqrt is
+        # the exact integer square root and the ceil-division gives the number
+        # of rows, with no trial division over divisors (primes included)
+        number = max(1, math.isqrt(num_sim))
+        y_num = (num_sim + number - 1) // number                # Y-axis limit
 
         x_sim = sim_idx % number
         y_sim = sim_idx // number
@@ -107,9 +98,9 @@ class VisualizationCallback(Callback):
                     vmin = 0., vmax = 1.,
                     label=labels[i])
 
-        for i in range(sim_idx.shape[0]):
+        for i in range(n_plot):
             plt.annotate(
-                text=str(sim_inst_dict[i].id),
+                text=str(sim_idx[i]),
                 xy=(x_sim[i], y_sim[i]),
                 color='black',
                 weight='bold',